@@ -24,6 +24,9 @@ import functools
 
 Tensor = torch.Tensor
 
+# Convolution classes by spatial dimensionality of the dataset
+_CONV_CLASSES = {1: nn.Conv1d, 2: nn.Conv2d, 3: nn.Conv3d}
+
 
 def ConvLayer(
     in_channels: int,
@@ -37,6 +40,7 @@ def ConvLayer(
     case: int = 2,
     kernel_init: Callable = None,
     bias_init: Callable = torch.nn.init.zeros_,
+    input_hw: tuple[int, int] | None = None,
     dtype: torch.dtype = torch.float32,
     device: Any | None = None,
     **kwargs,
@@ -54,21 +58,39 @@ def ConvLayer(
                 f"kernel size {kernel_size} must be a length-2 tuple "
                 f"for convolution type {padding_mode}."
             )
+        if isinstance(out_channels, (list, tuple)):
+            # A sequence of output channels requests a fused stack of
+            # lat-lon convolutions sharing a single padding pass.
+            return LatLonConvBlock(
+                channels=[in_channels, *out_channels],
+                kernel_size=kernel_size,
+                order=padding_mode.lower(),
+                use_bias=use_bias,
+                dtype=dtype,
+                device=device,
+            )
+
         return LatLonConv(
             in_channels=in_channels,
             out_channels=out_channels,
             kernel_size=kernel_size,
             order=padding_mode.lower(),
+            input_hw=input_hw,
             dtype=dtype,
             device=device,
             **kwargs,
         )
 
     elif use_local:
+        if input_hw is None:
+            raise ValueError(
+                "input_hw (spatial resolution) is required for local convolutions."
+            )
         return ConvLocal2d(
             in_channels=in_channels,
             out_channels=out_channels,
             kernel_size=kernel_size,
+            input_hw=input_hw,
             padding=padding,
             stride=stride,
             use_bias=use_bias,
@@ -76,42 +98,20 @@ def ConvLayer(
             dtype=dtype,
         )
     else:
-        if case == 1:
-            conv_layer = nn.Conv1d(
-                in_channels=in_channels,
-                out_channels=out_channels,
-                kernel_size=kernel_size,
-                padding_mode=padding_mode.lower(),
-                padding=padding,
-                stride=stride,
-                bias=use_bias,
-                device=device,
-                dtype=dtype,
-            )
-        elif case == 2:
-            conv_layer = nn.Conv2d(
-                in_channels=in_channels,
-                out_channels=out_channels,
-                kernel_size=kernel_size,
-                padding_mode=padding_mode.lower(),
-                padding=padding,
-                stride=stride,
-                bias=use_bias,
-                device=device,
-                dtype=dtype,
-            )
-        elif case == 3:
-            conv_layer = nn.Conv3d(
-                in_channels=in_channels,
-                out_channels=out_channels,
-                kernel_size=kernel_size,
-                padding_mode=padding_mode.lower(),
-                padding=padding,
-                stride=stride,
-                bias=use_bias,
-                device=device,
-                dtype=dtype,
-            )
+        if case not in _CONV_CLASSES:
+            raise ValueError(f"Convolution case {case} must be 1, 2 or 3.")
+
+        conv_layer = _CONV_CLASSES[case](
+            in_channels=in_channels,
+            out_channels=out_channels,
+            kernel_size=kernel_size,
+            padding_mode=padding_mode.lower(),
+            padding=padding,
+            stride=stride,
+            bias=use_bias,
+            device=device,
+            dtype=dtype,
+        )
 
     # Initialize weights and biases
     if kernel_init is not None:
@@ -129,6 +129,7 @@ class ConvLocal2d(nn.Module):
         in_channels,
         out_channels,
         kernel_size,
+        input_hw: tuple[int, int],
         stride: int = 1,
         padding: int = 0,
         padding_mode: str = "constant",
@@ -151,8 +152,17 @@ class ConvLocal2d(nn.Module):
         self.device = device
         self.dtype = dtype
 
-        # Weights for each spatial location (out_height x out_width)
-        self.weights = None
+        # The locally connected weights depend on the spatial resolution, so
+        # it is required at construction time. Eager allocation keeps all
+        # parameters visible to the optimizer and DDP and avoids a branch in
+        # every forward pass.
+        self.out_height = (
+            input_hw[0] - self.kernel_size[0] + 2 * self.padding
+        ) // self.stride[0] + 1
+        self.out_width = (
+            input_hw[1] - self.kernel_size[1] + 2 * self.padding
+        ) // self.stride[1] + 1
+        self._build_weights(self.out_height, self.out_width)
 
         if self.use_bias:
             self.bias = nn.Parameter(
@@ -161,6 +171,19 @@ class ConvLocal2d(nn.Module):
         else:
             self.bias = None
 
+    def _build_weights(self, out_height: int, out_width: int):
+        """Allocates and initializes the per-location weights once."""
+        self.weights = nn.Parameter(
+            torch.empty(
+                out_height * out_width,
+                self.out_channels,
+                self.in_channels * self.kernel_size[0] * self.kernel_size[1],
+                device=self.device,
+                dtype=self.dtype,
+            )
+        )
+        torch.nn.init.xavier_uniform_(self.weights)
+
     def forward(self, x):
         if len(x.shape) < 4:
             raise ValueError(
@@ -171,56 +194,30 @@ class ConvLocal2d(nn.Module):
         # width, height = lat, lon
         batch_size, in_channels, height, width = x.shape
 
-        if self.padding > 0:
+        if self.padding > 0 and self.padding_mode != "constant":
             x = F.pad(
                 x,
                 [self.padding, self.padding, self.padding, self.padding],
                 mode=self.padding_mode,
-                value=0,
             )
-
-        out_height = (height - self.kernel_size[0] + 2 * self.padding) // self.stride[
-            0
-        ] + 1
-        out_width = (width - self.kernel_size[1] + 2 * self.padding) // self.stride[
-            1
-        ] + 1
-
-        # Initialize weights
-        if self.weights is None:
-            self.weights = nn.Parameter(
-                torch.empty(
-                    out_height,
-                    out_width,
-                    self.out_channels,
-                    in_channels,
-                    self.kernel_size[0],
-                    self.kernel_size[1],
-                    device=self.device,  # x.device
-                    dtype=self.dtype,
-                )
-            )
-            torch.nn.init.xavier_uniform_(self.weights)
-
-        output = torch.zeros(
-            (batch_size, self.out_channels, out_height, out_width),
-            dtype=self.dtype,
-            device=self.device,
+            unfold_padding = 0
+        else:
+            # Zero padding is folded into the im2col traversal itself,
+            # skipping the full padded copy of the input.
+            unfold_padding = self.padding
+
+        # im2col: extract all windows at once, (batch_size, c*kh*kw, l)
+        # with l = out_height * out_width, then contract each location
+        # against its own filter: with the batch dimension over l,
+        # (l, out_c, k) @ (l, k, batch_size) maps directly onto a cuBLAS
+        # strided-batched GEMM.
+        patches = F.unfold(
+            x, kernel_size=self.kernel_size, stride=self.stride, padding=unfold_padding
+        )
+        output = torch.bmm(self.weights, patches.permute(2, 1, 0))
+        output = output.permute(2, 1, 0).reshape(
+            batch_size, self.out_channels, self.out_height, self.out_width
         )
-
-        # manually scripted convolution.
-        for i in range(out_height):
-            for j in range(out_width):
-                patch = x[
-                    :,
-                    :,
-                    i * self.stride[0] : i * self.stride[0] + self.kernel_size[0],
-                    j * self.stride[1] : j * self.stride[1] + self.kernel_size[1],
-                ]
-                # Sums of the product based on Einstein's summation convention
-                output[:, :, i, j] = torch.einsum(
-                    "bchw, ocwh->bo", patch, self.weights[i, j]
-                )
 
         if self.use_bias:
             bias_shape = [1] * len(x.shape)
@@ -230,8 +227,60 @@ class ConvLocal2d(nn.Module):
         return output
 
 
+def _pad_lat_lon(
+    inputs: Tensor, pad_h: int, pad_w: int, circular_axis: int
+) -> Tensor:
+    """Pads the two trailing (spatial) axes of `inputs` in a single allocation.
+
+    The longitudinal axis (`circular_axis`, either -1 or -2) is padded
+    circularly while the remaining latitudinal axis is padded with its edge
+    values. Both paddings are written into one pre-allocated buffer instead
+    of materializing a full intermediate tensor per `F.pad` call.
+    """
+    height, width = inputs.shape[-2], inputs.shape[-1]
+    padded_h, padded_w = height + 2 * pad_h, width + 2 * pad_w
+    padded = inputs.new_empty((*inputs.shape[:-2], padded_h, padded_w))
+    padded[..., pad_h : pad_h + height, pad_w : pad_w + width] = inputs
+
+    if circular_axis == -1:
+        # Circular along the last axis, edge values along the second to last
+        if pad_w > 0:
+            padded[..., pad_h : pad_h + height, :pad_w] = inputs[..., :, -pad_w:]
+            padded[..., pad_h : pad_h + height, pad_w + width :] = inputs[
+                ..., :, :pad_w
+            ]
+        if pad_h > 0:
+            padded[..., :pad_h, :] = padded[..., pad_h : pad_h + 1, :]
+            padded[..., pad_h + height :, :] = padded[
+                ..., pad_h + height - 1 : pad_h + height, :
+            ]
+    elif circular_axis == -2:
+        # Circular along the second to last axis, edge values along the last
+        if pad_h > 0:
+            padded[..., :pad_h, pad_w : pad_w + width] = inputs[..., -pad_h:, :]
+            padded[..., pad_h + height :, pad_w : pad_w + width] = inputs[
+                ..., :pad_h, :
+            ]
+        if pad_w > 0:
+            padded[..., :pad_w] = padded[..., pad_w : pad_w + 1]
+            padded[..., pad_w + width :] = padded[
+                ..., pad_w + width - 1 : pad_w + width
+            ]
+    else:
+        raise ValueError(f"Circular axis {circular_axis} must be -1 or -2.")
+
+    return padded
+
+
 class LatLonConv(nn.Module):
-    """2D convolutional layer adapted to inputs a lot-lon grid"""
+    """2D convolutional layer adapted to inputs a lot-lon grid
+
+    The circular/edge padding is applied explicitly and the internal
+    convolution runs with padding=0, which keeps cuDNN on its fast
+    zero-padded implicit-GEMM path (circular or replicate padding inside
+    the convolution itself is much slower) and lets the autotuner pick
+    algorithms per shape.
+    """
 
     def __init__(
         self,
@@ -242,6 +291,7 @@ class LatLonConv(nn.Module):
         use_bias: bool = True,
         strides: tuple[int, int] = (1, 1),
         use_local: bool = False,
+        input_hw: tuple[int, int] | None = None,
         dtype: torch.dtype = torch.float32,
         device: Any | None = None,
         **kwargs,
@@ -257,13 +307,42 @@ class LatLonConv(nn.Module):
         self.dtype = dtype
         self.device = device
 
+        if self.kernel_size[0] % 2 == 0 or self.kernel_size[1] % 2 == 0:
+            raise ValueError(f"Current kernel size {self.kernel_size} must be odd.")
+
+        # Padding amounts for the two trailing (spatial) axes and the axis
+        # that receives circular (longitude) padding, resolved once here so
+        # the forward pass only does the padding and the convolution.
+        self._pad_h = self.kernel_size[0] // 2
+        self._pad_w = self.kernel_size[1] // 2
+        if self.order == "latlon":
+            # Spatial axes are (lat, lon): lon is the last axis
+            self._circular_axis = -1
+        elif self.order == "lonlat":
+            # Spatial axes are (lon, lat): lon is the second to last axis
+            self._circular_axis = -2
+        else:
+            raise ValueError(
+                f"Unrecogniized order {self.order} - 'loatlon' or 'lonlat expected."
+            )
+
         if self.use_local:
+            if input_hw is None:
+                raise ValueError(
+                    "input_hw (spatial resolution) is required for local convolutions."
+                )
+            # The local convolution sees the padded grid.
+            padded_hw = (
+                input_hw[0] + 2 * self._pad_h,
+                input_hw[1] + 2 * self._pad_w,
+            )
             self.conv = ConvLocal2d(
                 in_channels=self.in_channels,
                 out_channels=self.out_channels,
                 kernel_size=kernel_size,
+                input_hw=padded_hw,
                 stride=strides,
-                bias=use_bias,
+                use_bias=use_bias,
                 dtype=self.dtype,
                 device=self.device,
             )
@@ -284,27 +363,96 @@ class LatLonConv(nn.Module):
         if len(inputs.shape) < 4:
             raise ValueError(f"Input must be 4D or higher: {inputs.shape}.")
 
-        if self.kernel_size[0] % 2 == 0 or self.kernel_size[1] % 2 == 0:
-            raise ValueError(f"Current kernel size {self.kernel_size} must be odd.")
+        padded_inputs = _pad_lat_lon(
+            inputs,
+            pad_h=self._pad_h,
+            pad_w=self._pad_w,
+            circular_axis=self._circular_axis,
+        )
+        return self.conv(padded_inputs)
 
-        if self.order == "latlon":
-            lon_axis, lat_axis = (-3, -2)
-            lat_pad, lon_pad = self.kernel_size[0] // 2, self.kernel_size[1] // 2
-        elif self.order == "lonlat":
-            lon_axis, lat_axis = (-3, -2)
-            lon_pad, lat_pad = self.kernel_size[1] // 2, self.kernel_size[0] // 2
-            # TODO: There is no difference lon_axis and lat_axis in "lonlat" should be switched?
+
+class LatLonConvBlock(nn.Module):
+    """Stack of lat-lon convolutions sharing a single padding pass.
+
+    Consecutive `LatLonConv` layers with the same kernel size and order each
+    re-materialize a padded copy of their input. This block instead pads once
+    with the combined amount of all layers (exact along the circular
+    longitude axis; the latitude edge values are replicated once up front)
+    and chains valid (padding=0) convolutions, each consuming part of the
+    border, so the activation only returns to the input resolution after the
+    last layer. Cuts the padding memory traffic proportional to the depth of
+    the stack.
+
+    Arguments:
+      channels: channel sizes `[in, hidden..., out]`; one convolution is
+        built per consecutive pair.
+      kernel_size: kernel size shared by all convolutions, must be odd.
+      order: whether the spatial axes are ordered (lat, lon) or (lon, lat).
+      use_bias: If True, adds a learnable bias to each convolution.
+    """
+
+    def __init__(
+        self,
+        channels: Sequence[int],
+        kernel_size: tuple[int, int] = (3, 3),
+        order: Literal["latlon", "lonlat"] = "latlon",
+        use_bias: bool = True,
+        dtype: torch.dtype = torch.float32,
+        device: Any | None = None,
+    ):
+        super(LatLonConvBlock, self).__init__()
+        if len(channels) < 2:
+            raise ValueError(
+                f"channels {channels} must contain at least an input and an "
+                f"output channel count."
+            )
+        if kernel_size[0] % 2 == 0 or kernel_size[1] % 2 == 0:
+            raise ValueError(f"Current kernel size {kernel_size} must be odd.")
+
+        self.kernel_size = kernel_size
+        self.order = order
+        self._pad_h = kernel_size[0] // 2
+        self._pad_w = kernel_size[1] // 2
+        if order == "latlon":
+            self._circular_axis = -1
+        elif order == "lonlat":
+            self._circular_axis = -2
         else:
             raise ValueError(
-                f"Unrecogniized order {self.order} - 'loatlon' or 'lonlat expected."
+                f"Unrecogniized order {order} - 'loatlon' or 'lonlat expected."
             )
 
-        # Circular padding to longitudinal (lon) axis
-        padded_inputs = F.pad(inputs, [0, 0, lon_pad, lon_pad], mode="circular")
-        # Edge padding to latitudinal (lat) axis
-        padded_inputs = F.pad(padded_inputs, [lat_pad, lat_pad, 0, 0], mode="replicate")
+        self.convs = nn.ModuleList(
+            [
+                nn.Conv2d(
+                    in_channels=c_in,
+                    out_channels=c_out,
+                    kernel_size=kernel_size,
+                    padding=0,
+                    bias=use_bias,
+                    device=device,
+                    dtype=dtype,
+                )
+                for c_in, c_out in zip(channels[:-1], channels[1:])
+            ]
+        )
 
-        return self.conv(padded_inputs)
+    def forward(self, inputs):
+        """Pads once for the whole stack, then applies the valid convolutions."""
+        if len(inputs.shape) < 4:
+            raise ValueError(f"Input must be 4D or higher: {inputs.shape}.")
+
+        depth = len(self.convs)
+        h = _pad_lat_lon(
+            inputs,
+            pad_h=depth * self._pad_h,
+            pad_w=depth * self._pad_w,
+            circular_axis=self._circular_axis,
+        )
+        for conv in self.convs:
+            h = conv(h)
+        return h
 
 
 class DownsampleConv(nn.Module):
@@ -363,51 +511,51 @@ class DownsampleConv(nn.Module):
         else:
             self.kernel_init = kernel_init
 
-        # For downsampling padding = 0 and stride > 1
-        if case == 1:
-            self.conv_layer = nn.Conv1d(
-                in_channels=self.in_channels,
-                out_channels=self.out_channels,
-                kernel_size=ratios,
-                stride=ratios,
-                bias=use_bias,
-                padding=0,
-                device=self.device,
-                dtype=self.dtype,
-            )
+        if case not in _CONV_CLASSES:
+            raise ValueError(f"Dataset dimension should either be 1D, 2D or 3D")
+        conv_cls = _CONV_CLASSES[case]
 
-        elif case == 2:
-            self.conv_layer = nn.Conv2d(
+        # Depthwise separable factorization of the dense strided kernel:
+        # a depthwise (grouped) strided convolution followed by a pointwise
+        # 1x1 convolution. For downsampling padding = 0 and stride > 1.
+        self.conv_layer = nn.Sequential(
+            conv_cls(
                 in_channels=self.in_channels,
-                out_channels=self.out_channels,
+                out_channels=self.in_channels,
                 kernel_size=ratios,
                 stride=ratios,
-                bias=use_bias,
+                groups=self.in_channels,
+                bias=False,
                 padding=0,
                 device=self.device,
                 dtype=self.dtype,
-            )
-
-        elif case == 3:
-            self.conv_layer = nn.Conv3d(
+            ),
+            conv_cls(
                 in_channels=self.in_channels,
                 out_channels=self.out_channels,
-                kernel_size=ratios,
-                stride=ratios,
+                kernel_size=1,
                 bias=use_bias,
-                padding=0,
                 device=self.device,
                 dtype=self.dtype,
-            )
-        else:
-            raise ValueError(f"Dataset dimension should either be 1D, 2D or 3D")
+            ),
+        )
 
         # Initialize with variance_scaling
         # Only use this if the activation function is ReLU or smth. similar
-        self.kernel_init(self.conv_layer.weight)
-        self.bias_init(self.conv_layer.bias)
+        self.kernel_init(self.conv_layer[0].weight)
+        self.kernel_init(self.conv_layer[1].weight)
+        if use_bias:
+            self.bias_init(self.conv_layer[1].bias)
+
+        if case == 3:
+            # NDHWC layout lets cuDNN pick its channels-last 3D kernels
+            self.conv_layer = self.conv_layer.to(
+                memory_format=torch.channels_last_3d
+            )
 
     def forward(self, inputs):
         """Applies strided convolution for downsampling."""
+        if self.kernel_dim == 3 and inputs.ndim == 5:
+            inputs = inputs.to(memory_format=torch.channels_last_3d)
 
         return self.conv_layer(inputs)
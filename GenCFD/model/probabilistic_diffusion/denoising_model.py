@@ -228,8 +228,10 @@ class DenoisingModel(BaseModel):
             * torch.mean(weights * torch.square(denoised_squared - x_squared))
         )
 
-        # Additional metrics can be stored here
-        metrics = {"loss": loss.item()}
+        # Additional metrics can be stored here. The loss is kept as a device
+        # tensor: `.item()` would force a host sync every step and is not
+        # permitted during CUDA graph capture.
+        metrics = {"loss": loss.detach()}
 
         return loss, metrics
 
@@ -313,9 +315,9 @@ class DenoisingModel(BaseModel):
         ema_losses = torch.mean(
             torch.square(denoised - x), dim=[i for i in range(1, x.ndim)]
         )
-        eval_losses = {
-            f"denoise_lvl{i}": loss.item() for i, loss in enumerate(ema_losses)
-        }
+        # Kept as device tensors: the metric collections accumulate on-device
+        # and sync to the host once per evaluation run, not per batch.
+        eval_losses = {f"denoise_lvl{i}": loss for i, loss in enumerate(ema_losses)}
         return eval_losses
 
     @staticmethod
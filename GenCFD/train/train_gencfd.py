@@ -94,7 +94,7 @@ if __name__ == "__main__":
         name=args.dataset,
         batch_size=args.batch_size,
         num_worker=args.worker,
-        prefetch_factor=2,  # Default DataLoader value
+        prefetch_factor=4,
         split=True,
         split_ratio=0.99,
     )
@@ -143,12 +143,15 @@ if __name__ == "__main__":
             denoising_model.denoiser.parameters(),
             lr=args.peak_lr,
             weight_decay=args.weight_decay,
+            # Single-kernel fused Adam step on GPU (also CUDA-graph safe)
+            fused=True if device.type == "cuda" else False,
         ),
         device=device,
         ema_decay=args.ema_decay,
         store_ema=True,  # Store ema model as well
         track_memory=args.track_memory,
         use_mixed_precision=args.use_mixed_precision,
+        precision=args.precision,
         is_compiled=args.compile,
         world_size=args.world_size,
         local_rank=args.local_rank,
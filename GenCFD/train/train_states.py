@@ -38,10 +38,12 @@ class TrainState:
     """
 
     def __init__(self, step: int = 0):
+        # The step counter is a plain Python int: keeping it as a tensor
+        # would require a host-device sync (`.item()`) every time it is read
+        # on the hot path.
         if isinstance(step, Tensor):
-            self.step = step.clone().detach()
-        else:
-            self.step = torch.tensor(step)
+            step = int(step.item())
+        self.step = step
 
     @property
     def int_step(self) -> int:
@@ -93,11 +95,11 @@ class TrainState:
 
     def state_dict(self) -> Dict[str, Any]:
         "Returns the state dictionary for saving."
-        return {"step": self.step.item()}
+        return {"step": self.int_step}
 
     def update_from_checkpoint(self, checkpoint: Dict[str, Any]) -> None:
         "Update state attributes from checkpoint"
-        self.step = torch.tensor(checkpoint.get("step", self.step))
+        self.step = int(checkpoint.get("step", self.step))
 
 
 class BasicTrainState(TrainState):
@@ -121,10 +123,26 @@ class BasicTrainState(TrainState):
         super().__init__(step)
         self.model = model
         self.optimizer = optimizer
-        # self.params = params if params is not None else self.model.state_dict()
-        # self.opt_state = opt_state if opt_state is not None else self.optimizer.state_dict()
-        self.params = params
-        self.opt_state = opt_state
+        # Optional snapshots (e.g. restored from a checkpoint). On the hot
+        # path the state only holds *references* to the model and optimizer;
+        # their state dicts are materialized lazily on access instead of
+        # being copied every train step.
+        self._params = params
+        self._opt_state = opt_state
+
+    @property
+    def params(self):
+        """The model parameters, materialized on access."""
+        if self._params is not None:
+            return self._params
+        return self.model.state_dict() if self.model is not None else None
+
+    @property
+    def opt_state(self):
+        """The optimizer state, materialized on access."""
+        if self._opt_state is not None:
+            return self._opt_state
+        return self.optimizer.state_dict() if self.optimizer is not None else None
 
     @classmethod
     def restore_from_checkpoint(
@@ -220,14 +238,6 @@ class BasicTrainState(TrainState):
         self.model.load_state_dict(checkpoint["params"])
         self.optimizer.load_state_dict(checkpoint["opt_state"])
 
-    def replace(
-        self, step: int, params: Dict[str, Any] = None, opt_state: Dict[str, Any] = None
-    ):
-        """Replaces state values with updated fields."""
-        self.step = step
-        self.params = params
-        self.opt_state = opt_state
-
 
 class DenoisingModelTrainState(BasicTrainState):
     """Train state with an additional field tracking the EMA parameters."""
@@ -257,7 +267,29 @@ class DenoisingModelTrainState(BasicTrainState):
             if store_ema
             else None
         )
-        self.ema = self.ema_parameters if store_ema else None
+        # Cache the parameter lists once so that the per-step EMA update can
+        # run as two multi-tensor (foreach) kernels instead of a Python loop
+        # issuing one kernel per parameter.
+        if store_ema:
+            self._ema_param_list = list(self.ema_model.module.parameters())
+            self._model_param_list = list(self.model.parameters())
+
+    @torch.no_grad()
+    def update_ema(self):
+        """Updates the EMA parameters in-place with foreach kernels.
+
+        Equivalent to `ema_model.update_parameters` with the EMA averaging
+        function, but avoids rebuilding the parameter lists on every call.
+        """
+        torch._foreach_mul_(self._ema_param_list, self.ema_decay)
+        torch._foreach_add_(
+            self._ema_param_list, self._model_param_list, alpha=1.0 - self.ema_decay
+        )
+
+    @property
+    def ema(self):
+        """The EMA parameters, materialized on access (e.g. at checkpointing)."""
+        return self.ema_parameters if self.ema_model else None
 
     @property
     def ema_parameters(self):
@@ -266,17 +298,3 @@ class DenoisingModelTrainState(BasicTrainState):
             return self.ema_model.module.state_dict()
         else:
             raise ValueError("EMA model is None")
-
-    def replace(
-        self,
-        step: int,
-        params: Dict[str, Any] = None,
-        opt_state: Dict[str, Any] = None,
-        ema: Dict[str, Any] = None,
-    ):
-        """Replaces state values with updated fields."""
-
-        self.step = step
-        self.params = params
-        self.opt_state = opt_state
-        self.ema = ema
@@ -151,7 +151,7 @@ def get_dataset_loader(
     name: str,
     batch_size: int = 5,
     num_worker: int = 0,
-    prefetch_factor: int = 2,  # default DataLoader value
+    prefetch_factor: int = 4,
     split: bool = True,
     split_ratio: float = 0.9,
 ) -> Tuple[DataLoader, DataLoader] | DataLoader:
@@ -161,6 +161,11 @@ def get_dataset_loader(
     # dependent or not
     dataset, time_cond = get_dataset(name=name, is_time_dependent=True)
 
+    # Keep worker processes alive between epochs instead of respawning them
+    # at every iterator restart; prefetch_factor is only valid with workers.
+    persistent_workers = num_worker > 0
+    prefetch_factor = prefetch_factor if num_worker > 0 else None
+
     if args.world_size > 1:
         dist_sampler = get_distributed_sampler(args, dataset)
 
@@ -179,15 +184,18 @@ def get_dataset_loader(
             pin_memory=True,
             num_workers=num_worker,
             prefetch_factor=prefetch_factor,
+            persistent_workers=persistent_workers,
             sampler=train_sampler if args.world_size > 1 else None,
         )
+        # Evaluation does not require shuffling
         eval_dataloader = DataLoader(
             dataset=eval_dataset,
             batch_size=batch_size,
-            shuffle=True if args.world_size == 1 else False,
+            shuffle=False,
             pin_memory=True,
             num_workers=num_worker,
             prefetch_factor=prefetch_factor,
+            persistent_workers=persistent_workers,
             sampler=eval_sampler if args.world_size > 1 else None,
         )
         return (train_dataloader, eval_dataloader, dataset, time_cond)
@@ -203,6 +211,7 @@ def get_dataset_loader(
             pin_memory=True,
             num_workers=num_worker,
             prefetch_factor=prefetch_factor,
+            persistent_workers=persistent_workers,
             sampler=sampler if args.world_size > 1 else None,
         )
         return (dataloader, dataset, time_cond)
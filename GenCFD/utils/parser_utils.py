@@ -53,6 +53,10 @@ def add_base_options(parser: ArgumentParser):
                        help="Set the precision for PyTorch tensors by defining the dtype")
     group.add_argument("--use_mixed_precision", default=True, type=str_to_bool,
                        help="For memory efficiency activate mixed precision calculations")
+    group.add_argument("--precision", default=None, type=str,
+                       choices=["fp32", "fp16", "bf16"],
+                       help="Autocast precision for training. Overrides --use_mixed_precision; "
+                            "bf16 runs without a gradient scaler on supported GPUs")
 
 
 def add_parallelization_options(parser: ArgumentParser):